@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from .config import TaxonomyConfig
 from .models import ClassificationResult, StageItem
@@ -54,66 +55,119 @@ LOG_KEYWORDS = {
     "blocked",
 }
 
-HASHTAG_RE = re.compile(r"(?<!\w)#([A-Za-z][A-Za-z0-9_-]{1,40})")
+# Equivalent to r"(?<!\w)#(...)"; leading with the literal "#" lets sre search for it in C.
+HASHTAG_RE = re.compile(r"#(?<!\w#)([A-Za-z][A-Za-z0-9_-]{1,40})")
 URL_RE = re.compile(r"https?://")
-DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
-CHECKBOX_RE = re.compile(r"^\s*[-*]\s*\[[ xX]\]", re.MULTILINE)
-
-
-def _keyword_score(text: str, keywords: set[str]) -> int:
-    score = 0
-    for keyword in keywords:
-        if keyword in text:
-            score += 1
-    return score
-
-
-def _compute_scores(text: str) -> Counter[str]:
-    lowered = text.lower()
-    scores: Counter[str] = Counter({"idea": 0, "todo": 0, "reference": 0, "log": 0})
-
-    scores["todo"] += _keyword_score(lowered, TODO_KEYWORDS)
-    scores["idea"] += _keyword_score(lowered, IDEA_KEYWORDS)
-    scores["reference"] += _keyword_score(lowered, REFERENCE_KEYWORDS)
-    scores["log"] += _keyword_score(lowered, LOG_KEYWORDS)
-
-    if CHECKBOX_RE.search(text):
-        scores["todo"] += 3
+# Equivalent to r"\b\d{4}-\d{2}-\d{2}\b", but leading with \d lets sre skip non-digits in C.
+DATE_RE = re.compile(r"\d(?<!\w\d)\d{3}-\d{2}-\d{2}(?!\w)")
+CHECKBOX_MARKS = ("[ ]", "[x]", "[X]")
+
+SCORE_CATEGORIES = ("idea", "todo", "reference", "log")
+IDEA, TODO, REFERENCE, LOG = range(len(SCORE_CATEGORIES))
+
+KEYWORD_TABLE: tuple[tuple[str, int], ...] = tuple(
+    (keyword, slot)
+    for slot, keywords in (
+        (TODO, TODO_KEYWORDS),
+        (IDEA, IDEA_KEYWORDS),
+        (REFERENCE, REFERENCE_KEYWORDS),
+        (LOG, LOG_KEYWORDS),
+    )
+    for keyword in sorted(keywords)
+)
+
+# Below this many items a process pool's startup and pickling cost more than serial classification.
+PARALLEL_CLASSIFY_MIN_ITEMS = 512
+
+CLASSIFY_CACHE_SIZE = 4096
+_CLASSIFY_CACHE: dict[tuple[str, tuple[str, ...], bool], ClassificationResult] = {}
+
+
+def _has_checkbox(text: str) -> bool:
+    r"""Return True if a line holds a "- [ ]"/"* [x]" style checkbox.
+
+    Matches exactly what r"^\s*[-*]\s*\[[ xX]\]" (re.MULTILINE) matched, but only
+    inspects positions where a "[" occurs instead of running the regex engine per line.
+    """
+    start = text.find("[")
+    while start != -1:
+        if text.startswith(CHECKBOX_MARKS, start):
+            i = start - 1
+            while i >= 0 and text[i].isspace():
+                i -= 1
+            if i >= 0 and text[i] in "-*":
+                # The bullet must be preceded only by whitespace back to a line start.
+                i -= 1
+                while i >= 0 and text[i].isspace():
+                    if text[i] == "\n":
+                        return True
+                    i -= 1
+                if i < 0:
+                    return True
+        start = text.find("[", start + 1)
+    return False
+
+
+def _compute_scores(text: str, lowered: str) -> tuple[tuple[int, int, int, int], set[str]]:
+    """Return keyword/signal scores ordered like SCORE_CATEGORIES and the keywords that matched."""
+    scores = [0, 0, 0, 0]
+
+    hits: set[str] = set()
+    for keyword, slot in KEYWORD_TABLE:
+        if keyword in lowered:
+            scores[slot] += 1
+            hits.add(keyword)
+
+    if _has_checkbox(text):
+        scores[TODO] += 3
     if URL_RE.search(text):
-        scores["reference"] += 2
+        scores[REFERENCE] += 2
     if DATE_RE.search(text):
-        scores["log"] += 1
+        scores[LOG] += 1
 
-    if "?" in text and any(token in lowered for token in ("could", "maybe", "what if")):
-        scores["idea"] += 1
+    # "maybe" and "what if" are idea keywords, so reuse the hits instead of rescanning.
+    if "?" in text and (not hits.isdisjoint(("maybe", "what if")) or "could" in lowered):
+        scores[IDEA] += 1
 
-    return scores
+    idea, todo, reference, log = scores
+    return (idea, todo, reference, log), hits
 
 
-def _extract_tags(item: StageItem, category: str, allow_custom_tags: bool) -> list[str]:
+def _extract_tags(
+    item: StageItem,
+    category: str,
+    allow_custom_tags: bool,
+    lowered: str,
+    hits: set[str],
+) -> list[str]:
     tags: set[str] = {category}
 
     if category == "todo":
-        lowered = item.body.lower()
         if "urgent" in lowered or "asap" in lowered:
             tags.add("priority")
-        if "deadline" in lowered or "due" in lowered:
+        # "deadline" and "due" are todo keywords, so scoring already probed them.
+        if not hits.isdisjoint(("deadline", "due")):
             tags.add("deadline")
 
     if allow_custom_tags:
-        for match in HASHTAG_RE.findall(item.content):
-            tags.add(match.lower())
+        tags |= {match.group(1).lower() for match in HASHTAG_RE.finditer(item.content)}
 
     return sorted(tags)
 
 
-def classify_item(item: StageItem, taxonomy: TaxonomyConfig) -> ClassificationResult:
-    scores = _compute_scores(item.content)
-    sorted_scores = scores.most_common()
+def _classify_uncached(item: StageItem, taxonomy: TaxonomyConfig) -> ClassificationResult:
+    lowered = item.content.lower()
+    scores, hits = _compute_scores(item.content, lowered)
 
-    top_category, top_score = sorted_scores[0]
-    second_score = sorted_scores[1][1] if len(sorted_scores) > 1 else 0
-    total = sum(scores.values())
+    # Ties keep the earlier category, matching the previous Counter.most_common() order.
+    top_category, top_score = SCORE_CATEGORIES[0], scores[0]
+    second_score = -1
+    for category_name, score in zip(SCORE_CATEGORIES[1:], scores[1:]):
+        if score > top_score:
+            top_category, top_score, second_score = category_name, score, top_score
+        elif score > second_score:
+            second_score = score
+    total = sum(scores)
 
     if top_score == 0:
         category = "reference"
@@ -133,6 +187,57 @@ def classify_item(item: StageItem, taxonomy: TaxonomyConfig) -> ClassificationRe
         confidence = min(confidence, 0.35)
         reasoning = "category outside configured taxonomy; defaulted to reference"
 
-    tags = _extract_tags(item, category=category, allow_custom_tags=taxonomy.allow_custom_tags)
+    tags = _extract_tags(
+        item,
+        category=category,
+        allow_custom_tags=taxonomy.allow_custom_tags,
+        lowered=lowered,
+        hits=hits,
+    )
 
     return ClassificationResult(category=category, tags=tags, confidence=confidence, reasoning=reasoning)
+
+
+def classify_item(item: StageItem, taxonomy: TaxonomyConfig) -> ClassificationResult:
+    # content_hash is derived from content, the only part of the item classification reads.
+    key = (item.content_hash, tuple(taxonomy.core_categories), taxonomy.allow_custom_tags)
+    cached = _CLASSIFY_CACHE.get(key)
+    if cached is None:
+        cached = _classify_uncached(item, taxonomy)
+        if len(_CLASSIFY_CACHE) >= CLASSIFY_CACHE_SIZE:
+            del _CLASSIFY_CACHE[next(iter(_CLASSIFY_CACHE))]
+        _CLASSIFY_CACHE[key] = cached
+
+    return ClassificationResult(
+        category=cached.category,
+        tags=list(cached.tags),
+        confidence=cached.confidence,
+        reasoning=cached.reasoning,
+    )
+
+
+_worker_taxonomy: TaxonomyConfig | None = None
+
+
+def _init_classify_worker(taxonomy: TaxonomyConfig) -> None:
+    global _worker_taxonomy
+    _worker_taxonomy = taxonomy
+
+
+def _classify_in_worker(item: StageItem) -> ClassificationResult:
+    assert _worker_taxonomy is not None
+    return classify_item(item, _worker_taxonomy)
+
+
+def classify_items(items: list[StageItem], taxonomy: TaxonomyConfig) -> list[ClassificationResult]:
+    workers = os.cpu_count() or 1
+    if len(items) < PARALLEL_CLASSIFY_MIN_ITEMS or workers < 2:
+        return [classify_item(item, taxonomy) for item in items]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_classify_worker,
+        initargs=(taxonomy,),
+    ) as executor:
+        chunksize = max(1, len(items) // (4 * workers))
+        return list(executor.map(_classify_in_worker, items, chunksize=chunksize))
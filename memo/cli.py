@@ -94,7 +94,7 @@ def cmd_review(root: Path, proposal_id: str | None) -> int:
         print(f"- {item.entry_id}")
         print(f"  status={item.status} category={item.classification.category} confidence={item.classification.confidence}")
         print(f"  source={item.source_stage_path}")
-        print(f"  target={item.target_entry_path}")
+        print(f"  target={item.target_entry_path or '-'}")
         if item.summary:
             print(f"  summary_trigger={','.join(item.summary.triggered_by)}")
         if item.invalid_reason:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 from typing import Any
@@ -8,17 +9,29 @@ from .config import AppConfig
 from .models import CommitResult
 from .proposal import load_proposal
 from .stage import move_stage_to_processed
-from .storage import apply_proposal_to_vault
-from .utils import append_jsonl_atomic, ensure_dir, now_utc_iso, read_jsonl
+from .storage import (
+    append_committed_hash_keys,
+    apply_proposal_to_vault,
+    ensure_committed_hash_index,
+    load_committed_hash_keys,
+)
+from .utils import append_bytes, append_jsonl, atomic_write_text, ensure_dir, now_utc_iso, read_jsonl, read_text_utf8
 
 
-def _restore_file(path: Path, previous_content: str | None) -> None:
-    if previous_content is None:
+def _truncate_file(path: Path, previous_size: int | None) -> None:
+    if previous_size is None:
         if path.exists():
             path.unlink()
-    else:
-        ensure_dir(path.parent)
-        path.write_text(previous_content, encoding="utf-8")
+    elif path.exists():
+        os.truncate(path, previous_size)
+
+
+def _load_committed_proposal_ids(ids_index: Path, commits_index: Path) -> set[str]:
+    if not ids_index.exists():
+        # Bootstrap from the ledger (first run, or a vault from an older version).
+        ids = [str(record["proposal_id"]) for record in read_jsonl(commits_index) if record.get("proposal_id")]
+        atomic_write_text(ids_index, "".join(f"{proposal_id}\n" for proposal_id in dict.fromkeys(ids)))
+    return set(read_text_utf8(ids_index).splitlines())
 
 
 def commit_proposal(root: Path, proposal_id: str, config: AppConfig) -> CommitResult:
@@ -26,42 +39,50 @@ def commit_proposal(root: Path, proposal_id: str, config: AppConfig) -> CommitRe
 
     entries_index = root / "vault" / "index" / "entries.jsonl"
     commits_index = root / "vault" / "index" / "commits.jsonl"
+    hashes_index = root / "vault" / "index" / "hashes.bin"
+    ids_index = root / "vault" / "index" / "commit_ids.txt"
     ensure_dir(entries_index.parent)
 
-    commit_records = read_jsonl(commits_index)
-    if any(record.get("proposal_id") == proposal_id for record in commit_records):
+    if proposal_id in _load_committed_proposal_ids(ids_index, commits_index):
         raise RuntimeError(f"Proposal {proposal_id} was already committed")
+    previous_ids_size = ids_index.stat().st_size
 
-    existing_entry_records = read_jsonl(entries_index)
-    existing_hashes = {str(row.get("content_hash", "")) for row in existing_entry_records if row.get("content_hash")}
-
-    previous_entries_index: str | None = None
-    if entries_index.exists():
-        previous_entries_index = entries_index.read_text(encoding="utf-8")
+    existing_hashes = load_committed_hash_keys(root)
+    previous_hashes_size = hashes_index.stat().st_size if hashes_index.exists() else None
 
-    previous_commits_index: str | None = None
-    if commits_index.exists():
-        previous_commits_index = commits_index.read_text(encoding="utf-8")
+    # Indices are only ever appended to, so rolling back means truncating to these sizes.
+    previous_entries_size = entries_index.stat().st_size if entries_index.exists() else None
+    previous_commits_size = commits_index.stat().st_size if commits_index.exists() else None
 
     moved_stage_files: list[tuple[Path, Path]] = []
     written_paths: list[str] = []
 
-    invalid_entries = len([item for item in proposal.items if item.status == "invalid"])
+    # "duplicate" items were already committed at process time; ready items are re-checked below.
+    ready_entries = invalid_entries = known_duplicates = 0
+    for item in proposal.items:
+        if item.status == "ready":
+            ready_entries += 1
+        elif item.status == "invalid":
+            invalid_entries += 1
+        elif item.status == "duplicate":
+            known_duplicates += 1
 
     try:
-        entry_records, written_paths, committed_entries, skipped_duplicates = apply_proposal_to_vault(
-            root,
-            proposal,
-            existing_hashes=existing_hashes,
-        )
-
-        if entry_records:
-            append_jsonl_atomic(entries_index, entry_records)
-            if "vault/index/entries.jsonl" not in written_paths:
-                written_paths.append("vault/index/entries.jsonl")
+        # Done inside the rollback scope: a failed commit removes a sidecar it created.
+        ensure_committed_hash_index(root, existing_hashes)
+
+        committed_entries = 0
+        # Index each batch as soon as its files are written, so entry records are never all held at once.
+        for entry_records, batch_paths in apply_proposal_to_vault(root, proposal, existing_hashes=existing_hashes):
+            written_paths.extend(batch_paths)
+            append_jsonl(entries_index, entry_records)
+            append_committed_hash_keys(root, [str(record["content_hash"]) for record in entry_records])
+            committed_entries += len(entry_records)
+        # Every ready item is either committed or skipped as already present in the vault.
+        skipped_duplicates = ready_entries - committed_entries + known_duplicates
 
         for item in proposal.items:
-            if item.status != "ready":
+            if item.status not in ("ready", "duplicate"):
                 continue
             source = root / item.source_stage_path
             destination = move_stage_to_processed(root, item.source_stage_path, proposal_id)
@@ -81,7 +102,8 @@ def commit_proposal(root: Path, proposal_id: str, config: AppConfig) -> CommitRe
             "skipped_duplicates": skipped_duplicates,
             "invalid_entries": invalid_entries,
         }
-        append_jsonl_atomic(commits_index, [commit_record])
+        append_jsonl(commits_index, [commit_record])
+        append_bytes(ids_index, f"{proposal.proposal_id}\n".encode("utf-8"))
 
         return CommitResult(
             proposal_id=proposal.proposal_id,
@@ -98,8 +120,10 @@ def commit_proposal(root: Path, proposal_id: str, config: AppConfig) -> CommitRe
             if path.exists() and path.is_file():
                 path.unlink()
 
-        _restore_file(entries_index, previous_entries_index)
-        _restore_file(commits_index, previous_commits_index)
+        _truncate_file(entries_index, previous_entries_size)
+        _truncate_file(commits_index, previous_commits_size)
+        _truncate_file(hashes_index, previous_hashes_size)
+        _truncate_file(ids_index, previous_ids_size)
 
         for moved_destination, original_source in reversed(moved_stage_files):
             if moved_destination.exists():
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,7 +19,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "enabled": True,
         "min_words": 180,
         "batch_trigger_count": 5,
-        "redundancy_similarity_threshold": 0.85,
+        "redundancy_similarity_threshold": 0.7,
     },
     "git": {
         "default_branch": "main",
@@ -66,18 +68,32 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
     return output
 
 
+_yaml_module: Any = None
+_yaml_import_attempted = False
+
+
+def _yaml() -> Any:
+    # Import PyYAML at most once per process; None when it is not installed.
+    global _yaml_module, _yaml_import_attempted
+    if not _yaml_import_attempted:
+        _yaml_import_attempted = True
+        try:
+            import yaml  # type: ignore
+        except ModuleNotFoundError:
+            yaml = None
+        _yaml_module = yaml
+    return _yaml_module
+
+
 def _load_yaml_or_json(path: Path) -> dict[str, Any]:
     content = path.read_text(encoding="utf-8").strip()
     if not content:
         return {}
 
-    try:
-        import yaml  # type: ignore
-
+    yaml = _yaml()
+    if yaml is not None:
         loaded = yaml.safe_load(content)
         return loaded or {}
-    except ModuleNotFoundError:
-        pass
 
     try:
         loaded_json = json.loads(content)
@@ -92,8 +108,21 @@ def _load_yaml_or_json(path: Path) -> dict[str, Any]:
 
 def load_config(root: Path) -> AppConfig:
     config_path = root / "configs" / "memo.yaml"
+    try:
+        stat = config_path.stat()
+        signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        signature = None
+    # Callers get their own copy so changing it cannot leak into later loads; only the parse is cached.
+    return copy.deepcopy(_load_config_cached(str(config_path), signature))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path_str: str, signature: tuple[int, int] | None) -> AppConfig:
+    # `signature` is the file's (mtime_ns, size); it only keys the cache so edits are picked up.
+    config_path = Path(config_path_str)
     merged = dict(DEFAULT_CONFIG)
-    if config_path.exists():
+    if signature is not None:
         merged = _deep_merge(DEFAULT_CONFIG, _load_yaml_or_json(config_path))
 
     taxonomy_data = merged.get("taxonomy", {})
@@ -110,7 +139,7 @@ def load_config(root: Path) -> AppConfig:
             min_words=int(summarization_data.get("min_words", 180)),
             batch_trigger_count=int(summarization_data.get("batch_trigger_count", 5)),
             redundancy_similarity_threshold=float(
-                summarization_data.get("redundancy_similarity_threshold", 0.85)
+                summarization_data.get("redundancy_similarity_threshold", 0.7)
             ),
         ),
         git=GitConfig(
@@ -125,4 +154,5 @@ def init_default_config(root: Path) -> Path:
     ensure_dir(config_path.parent)
     rendered = json.dumps(DEFAULT_CONFIG, indent=2, ensure_ascii=True) + "\n"
     atomic_write_text(config_path, rendered)
+    _load_config_cached.cache_clear()
     return config_path
@@ -1,27 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     category: str
     tags: list[str]
     confidence: float
     reasoning: str = ""
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "category": self.category,
+            "tags": self.tags,
+            "confidence": self.confidence,
+            "reasoning": self.reasoning,
+        }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ClassificationResult":
         return cls(
-            category=data["category"],
+            category=sys.intern(str(data["category"])),
             tags=list(data.get("tags", [])),
             confidence=float(data.get("confidence", 0.0)),
             reasoning=str(data.get("reasoning", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     short_summary: str
     key_points: list[str]
@@ -29,6 +38,15 @@ class SummaryResult:
     triggered_by: list[str]
     redundancy_score: float | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "short_summary": self.short_summary,
+            "key_points": self.key_points,
+            "actions": self.actions,
+            "triggered_by": self.triggered_by,
+            "redundancy_score": self.redundancy_score,
+        }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SummaryResult":
         redundancy = data.get("redundancy_score")
@@ -41,7 +59,7 @@ class SummaryResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposalItem:
     entry_id: str
     source_stage_path: str
@@ -58,8 +76,22 @@ class ProposalItem:
     invalid_reason: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        return data
+        # Shallow on purpose: callers serialize the result and never mutate it.
+        return {
+            "entry_id": self.entry_id,
+            "source_stage_path": self.source_stage_path,
+            "content_hash": self.content_hash,
+            "created_at": self.created_at,
+            "body": self.body,
+            "frontmatter": self.frontmatter,
+            "warnings": self.warnings,
+            "classification": self.classification.to_dict(),
+            "summary": None if self.summary is None else self.summary.to_dict(),
+            "target_entry_path": self.target_entry_path,
+            "target_summary_path": self.target_summary_path,
+            "status": self.status,
+            "invalid_reason": self.invalid_reason,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ProposalItem":
@@ -77,12 +109,12 @@ class ProposalItem:
             else SummaryResult.from_dict(dict(data["summary"])),
             target_entry_path=str(data["target_entry_path"]),
             target_summary_path=data.get("target_summary_path"),
-            status=str(data.get("status", "ready")),
+            status=sys.intern(str(data.get("status", "ready"))),
             invalid_reason=data.get("invalid_reason"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     proposal_id: str
     created_at: str
@@ -113,7 +145,7 @@ class Proposal:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StageItem:
     source_path: str
     source_rel_path: str
@@ -123,9 +155,10 @@ class StageItem:
     body: str
     warnings: list[str] = field(default_factory=list)
     content: str = ""
+    entry_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitResult:
     proposal_id: str
     commit_ref: str
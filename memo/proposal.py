@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-import json
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .classify import classify_item
+from .classify import classify_items
 from .config import AppConfig
-from .models import Proposal, ProposalItem
+from .models import ClassificationResult, Proposal, ProposalItem
 from .stage import load_pending_stage_items, resolve_entry_id
-from .storage import target_entry_relative_path, target_summary_relative_path
-from .summarize import build_summary, load_existing_summary_texts, summarization_signals
-from .utils import atomic_write_json, atomic_write_text, ensure_dir, now_utc_iso
+from .storage import (
+    hash_key,
+    load_committed_hash_keys,
+    target_entry_relative_path,
+    target_summary_relative_path,
+)
+from .summarize import build_summary, load_existing_summaries, summarization_signals
+from .utils import atomic_write_json, atomic_write_text, ensure_dir, now_utc_iso, read_json
 
 
 def proposal_dir(root: Path) -> Path:
@@ -26,28 +31,71 @@ def _new_proposal_id() -> str:
 
 def build_proposal(root: Path, config: AppConfig) -> Proposal:
     stage_items = load_pending_stage_items(root)
-    existing_summary_texts = load_existing_summary_texts(root)
+    existing_summaries = load_existing_summaries(root)
+    committed_hashes = load_committed_hash_keys(root)
     pending_count = len(stage_items)
 
     proposal_id = _new_proposal_id()
     items: list[ProposalItem] = []
+    ready_count = invalid_count = duplicate_count = summary_count = 0
 
-    for stage_item in stage_items:
+    duplicate_flags = [
+        bool(stage_item.body.strip()) and hash_key(stage_item.content_hash) in committed_hashes
+        for stage_item in stage_items
+    ]
+    classifications = iter(
+        classify_items(
+            [stage_item for stage_item, duplicate in zip(stage_items, duplicate_flags) if not duplicate],
+            config.taxonomy,
+        )
+    )
+
+    for stage_item, duplicate in zip(stage_items, duplicate_flags):
         entry_id = resolve_entry_id(stage_item)
-        classification = classify_item(stage_item, config.taxonomy)
+        warnings = list(stage_item.warnings)
+
+        if duplicate:
+            # Already in the vault: skip classification and summarization entirely.
+            items.append(
+                ProposalItem(
+                    entry_id=entry_id,
+                    source_stage_path=stage_item.source_rel_path,
+                    content_hash=stage_item.content_hash,
+                    created_at=stage_item.created_at,
+                    body=stage_item.body,
+                    frontmatter=stage_item.frontmatter,
+                    warnings=warnings,
+                    classification=ClassificationResult(
+                        category="",
+                        tags=[],
+                        confidence=0.0,
+                        reasoning="content already committed; classification skipped",
+                    ),
+                    summary=None,
+                    target_entry_path="",
+                    target_summary_path=None,
+                    status="duplicate",
+                )
+            )
+            duplicate_count += 1
+            continue
+
+        classification = next(classifications)
 
         status = "ready"
         invalid_reason = None
-        warnings = list(stage_item.warnings)
         if not stage_item.body.strip():
             status = "invalid"
             invalid_reason = "empty body"
+            invalid_count += 1
+        else:
+            ready_count += 1
 
         signals, redundancy = summarization_signals(
             stage_item,
             pending_count=pending_count,
             config=config.summarization,
-            existing_summary_texts=existing_summary_texts,
+            existing_summaries=existing_summaries,
         )
 
         summary = None
@@ -60,6 +108,7 @@ def build_proposal(root: Path, config: AppConfig) -> Proposal:
                 redundancy_score=redundancy,
             )
             target_summary_path = target_summary_relative_path(entry_id)
+            summary_count += 1
 
         target_entry_path = target_entry_relative_path(entry_id, category=classification.category)
 
@@ -81,10 +130,6 @@ def build_proposal(root: Path, config: AppConfig) -> Proposal:
             )
         )
 
-    ready_count = len([item for item in items if item.status == "ready"])
-    invalid_count = len([item for item in items if item.status == "invalid"])
-    summary_count = len([item for item in items if item.summary is not None])
-
     commit_preview = f"{config.git.commit_prefix} apply proposal {proposal_id} ({ready_count} entries)"
 
     proposal = Proposal(
@@ -95,6 +140,7 @@ def build_proposal(root: Path, config: AppConfig) -> Proposal:
             "total_items": len(items),
             "ready_items": ready_count,
             "invalid_items": invalid_count,
+            "duplicate_items": duplicate_count,
             "summary_items": summary_count,
         },
         config_snapshot=config.to_dict(),
@@ -105,43 +151,42 @@ def build_proposal(root: Path, config: AppConfig) -> Proposal:
 
 
 def _render_proposal_markdown(proposal: Proposal) -> str:
-    lines = [
-        f"# Proposal {proposal.proposal_id}",
-        "",
-        f"Created: {proposal.created_at}",
-        f"Total items: {proposal.stats.get('total_items', 0)}",
-        f"Ready items: {proposal.stats.get('ready_items', 0)}",
-        f"Invalid items: {proposal.stats.get('invalid_items', 0)}",
-        f"Summary items: {proposal.stats.get('summary_items', 0)}",
-        "",
-        f"Commit preview: `{proposal.commit_message_preview}`",
-        "",
-        "## Items",
+    # Each part carries its own trailing newline, so the final join copies no separators.
+    parts = [
+        f"# Proposal {proposal.proposal_id}\n"
+        "\n"
+        f"Created: {proposal.created_at}\n"
+        f"Total items: {proposal.stats.get('total_items', 0)}\n"
+        f"Ready items: {proposal.stats.get('ready_items', 0)}\n"
+        f"Invalid items: {proposal.stats.get('invalid_items', 0)}\n"
+        f"Duplicate items: {proposal.stats.get('duplicate_items', 0)}\n"
+        f"Summary items: {proposal.stats.get('summary_items', 0)}\n"
+        "\n"
+        f"Commit preview: `{proposal.commit_message_preview}`\n"
+        "\n"
+        "## Items\n"
     ]
 
     for item in proposal.items:
-        lines.extend(
-            [
-                "",
-                f"### {item.entry_id}",
-                f"- status: {item.status}",
-                f"- source: `{item.source_stage_path}`",
-                f"- category: `{item.classification.category}`",
-                f"- confidence: {item.classification.confidence}",
-                f"- tags: {', '.join(item.classification.tags)}",
-                f"- target entry: `{item.target_entry_path}`",
-                f"- target summary: `{item.target_summary_path or '-'}`",
-            ]
+        parts.append(
+            "\n"
+            f"### {item.entry_id}\n"
+            f"- status: {item.status}\n"
+            f"- source: `{item.source_stage_path}`\n"
+            f"- category: `{item.classification.category}`\n"
+            f"- confidence: {item.classification.confidence}\n"
+            f"- tags: {', '.join(item.classification.tags)}\n"
+            f"- target entry: `{item.target_entry_path or '-'}`\n"
+            f"- target summary: `{item.target_summary_path or '-'}`\n"
         )
         if item.invalid_reason:
-            lines.append(f"- invalid reason: {item.invalid_reason}")
+            parts.append(f"- invalid reason: {item.invalid_reason}\n")
         if item.warnings:
-            lines.append(f"- warnings: {'; '.join(item.warnings)}")
+            parts.append(f"- warnings: {'; '.join(item.warnings)}\n")
         if item.summary:
-            lines.append(f"- summary trigger: {', '.join(item.summary.triggered_by)}")
+            parts.append(f"- summary trigger: {', '.join(item.summary.triggered_by)}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return "".join(parts)
 
 
 def save_proposal(root: Path, proposal: Proposal) -> tuple[Path, Path]:
@@ -159,7 +204,7 @@ def load_proposal(root: Path, proposal_id: str) -> Proposal:
     json_path = proposal_dir(root) / f"{proposal_id}.json"
     if not json_path.exists():
         raise FileNotFoundError(f"Proposal not found: {proposal_id}")
-    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    payload = read_json(json_path)
     return Proposal.from_dict(payload)
 
 
@@ -167,10 +212,15 @@ def latest_proposal_id(root: Path) -> str | None:
     directory = proposal_dir(root)
     if not directory.exists():
         return None
-    candidates = sorted(directory.glob("*.json"))
-    if not candidates:
+    # Proposal ids start with a UTC timestamp, so the greatest file name is the latest.
+    latest: str | None = None
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and (latest is None or entry.name > latest):
+                latest = entry.name
+    if latest is None:
         return None
-    return candidates[-1].stem
+    return latest[: -len(".json")]
 
 
 def load_latest_proposal(root: Path) -> Proposal:
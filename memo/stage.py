@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import shutil
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from .models import StageItem
-from .utils import ensure_dir, sha256_text
+from .utils import decode_utf8_text, ensure_dir, sha256_text
 
 
 FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
 
+# Smaller inboxes load faster serially than the thread pool takes to start.
+PARALLEL_LOAD_MIN_FILES = 32
+
 
 def stage_inbox(root: Path) -> Path:
     return root / "stage" / "inbox"
@@ -22,11 +30,21 @@ def stage_processed(root: Path) -> Path:
     return root / "stage" / "processed"
 
 
+def _walk_files(directory: str) -> Iterator[str]:
+    # DirEntry caches the d_type from readdir, so this needs no extra stat per entry.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
 def list_pending_stage_files(root: Path) -> list[Path]:
     inbox = stage_inbox(root)
     if not inbox.exists():
         return []
-    return sorted(path for path in inbox.glob("**/*") if path.is_file())
+    return sorted(Path(path) for path in _walk_files(str(inbox)))
 
 
 def stage_add(root: Path, source_path: Path) -> Path:
@@ -50,7 +68,8 @@ def stage_add(root: Path, source_path: Path) -> Path:
 
 def _parse_frontmatter(content: str) -> tuple[dict[str, Any], str, list[str]]:
     warnings: list[str] = []
-    match = FRONTMATTER_RE.match(content)
+    # Most notes have no frontmatter; a prefix check is cheaper than a failed regex match.
+    match = FRONTMATTER_RE.match(content) if content.startswith("---") else None
     if not match:
         return {}, content, warnings
 
@@ -60,30 +79,41 @@ def _parse_frontmatter(content: str) -> tuple[dict[str, Any], str, list[str]]:
     frontmatter: dict[str, Any] = {}
     for line in fm_raw.splitlines():
         stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        if not stripped or stripped[0] == "#":
             continue
-        if ":" not in stripped:
+        # `stripped` has no outer whitespace, so only the inner sides of key/value need trimming.
+        key, sep, value = stripped.partition(":")
+        if not sep:
             warnings.append("frontmatter line ignored (missing ':'): " + stripped)
             continue
-        key, value = stripped.split(":", 1)
-        frontmatter[key.strip()] = value.strip().strip('"')
+        frontmatter[key.rstrip()] = value.lstrip().strip('"')
 
     return frontmatter, body, warnings
 
 
 def _to_iso_from_epoch(epoch_seconds: float) -> str:
-    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).replace(microsecond=0).isoformat()
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).isoformat(timespec="seconds")
+
+
+def _entry_id_for_hash(content_hash: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, content_hash))
 
 
 def load_stage_item(root: Path, path: Path) -> StageItem:
-    raw_content = path.read_text(encoding="utf-8")
+    raw_bytes = path.read_bytes()
+    raw_content, translated = decode_utf8_text(raw_bytes)
+    if translated:
+        # Hash the newline-normalized text so CRLF and LF copies of a note dedupe together.
+        content_hash = sha256_text(raw_content)
+    else:
+        # Valid UTF-8 round-trips exactly, so the file bytes hash the same as the text.
+        content_hash = hashlib.sha256(raw_bytes).hexdigest()
     frontmatter, body, warnings = _parse_frontmatter(raw_content)
     stripped_body = body.strip()
     if not stripped_body:
         warnings.append("body is empty")
 
-    content_hash = sha256_text(raw_content)
-    entry_id = str(uuid.uuid5(uuid.NAMESPACE_URL, content_hash))
+    entry_id = _entry_id_for_hash(content_hash)
     created_at = _to_iso_from_epoch(path.stat().st_mtime)
 
     return StageItem(
@@ -95,15 +125,23 @@ def load_stage_item(root: Path, path: Path) -> StageItem:
         body=stripped_body,
         warnings=warnings,
         content=raw_content,
+        entry_id=entry_id,
     )
 
 
 def load_pending_stage_items(root: Path) -> list[StageItem]:
-    return [load_stage_item(root, path) for path in list_pending_stage_files(root)]
+    paths = list_pending_stage_files(root)
+    if len(paths) < PARALLEL_LOAD_MIN_FILES:
+        return [load_stage_item(root, path) for path in paths]
+
+    # File reads and SHA-256 over larger buffers release the GIL, so threads overlap the I/O.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return list(executor.map(partial(load_stage_item, root), paths))
 
 
 def resolve_entry_id(item: StageItem) -> str:
-    return str(uuid.uuid5(uuid.NAMESPACE_URL, item.content_hash))
+    # load_stage_item fills entry_id; items built elsewhere fall back to deriving it.
+    return item.entry_id or _entry_id_for_hash(item.content_hash)
 
 
 def move_stage_to_processed(root: Path, source_rel_path: str, proposal_id: str) -> Path:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from .models import Proposal, ProposalItem
-from .utils import atomic_write_text, ensure_dir, now_utc_iso
+from .utils import append_bytes, atomic_write_bytes, atomic_write_text, ensure_dir, now_utc_iso, read_jsonl
 
 
 CATEGORY_FOLDER_MAP = {
@@ -15,6 +18,61 @@ CATEGORY_FOLDER_MAP = {
 }
 
 
+HASH_KEY_SIZE = 16
+
+# Below this many files the thread pool costs more than the writes it overlaps.
+PARALLEL_WRITE_MIN_FILES = 64
+
+# Entries rendered and written per batch yielded by apply_proposal_to_vault.
+APPLY_BATCH_ENTRIES = 256
+
+
+def hash_key(content_hash: str) -> bytes:
+    """Return the fixed-width key stored in hashes.bin: the first 16 bytes of a SHA-256 hex digest."""
+    # hashes.bin is read in fixed-width slices, so a short key would corrupt every key after it.
+    digest = b""
+    if len(content_hash) == 64:
+        try:
+            digest = bytes.fromhex(content_hash)
+        except ValueError:
+            pass
+    if len(digest) != 32:
+        raise ValueError(f"content hash is not a 64-character hex SHA-256 digest: {content_hash!r}")
+    return digest[:HASH_KEY_SIZE]
+
+
+def _hashes_index_path(root: Path) -> Path:
+    return root / "vault" / "index" / "hashes.bin"
+
+
+def load_committed_hash_keys(root: Path) -> set[bytes]:
+    """Read the committed hash keys without writing anything to the vault.
+
+    Falls back to the entry index when the sidecar is missing (first run, or a vault from an
+    older version); `ensure_committed_hash_index` writes it during the next commit.
+    """
+    hashes_index = _hashes_index_path(root)
+    if not hashes_index.exists():
+        rows = read_jsonl(root / "vault" / "index" / "entries.jsonl")
+        return {hash_key(str(row["content_hash"])) for row in rows if row.get("content_hash")}
+
+    data = hashes_index.read_bytes()
+    usable = len(data) - len(data) % HASH_KEY_SIZE
+    return {data[offset : offset + HASH_KEY_SIZE] for offset in range(0, usable, HASH_KEY_SIZE)}
+
+
+def ensure_committed_hash_index(root: Path, keys: set[bytes]) -> None:
+    """Write the sidecar from `keys` (as returned by `load_committed_hash_keys`) if it is missing."""
+    hashes_index = _hashes_index_path(root)
+    if not hashes_index.exists():
+        atomic_write_bytes(hashes_index, b"".join(keys))
+
+
+def append_committed_hash_keys(root: Path, content_hashes: list[str]) -> None:
+    # Synced like entries.jsonl, so after a crash the sidecar is not missing committed keys.
+    append_bytes(_hashes_index_path(root), b"".join(hash_key(content_hash) for content_hash in content_hashes))
+
+
 def category_folder(category: str) -> str:
     return CATEGORY_FOLDER_MAP.get(category, "references")
 
@@ -29,19 +87,18 @@ def target_summary_relative_path(entry_id: str) -> str:
 
 
 def _render_frontmatter(payload: dict[str, Any]) -> str:
-    lines = ["---"]
+    parts = ["---\n"]
     for key, value in payload.items():
         if isinstance(value, list):
-            lines.append(f"{key}:")
-            for item in value:
-                lines.append(f"  - {item}")
+            parts.append(f"{key}:\n")
+            parts.extend(f"  - {item}\n" for item in value)
         elif value is None:
-            lines.append(f"{key}: null")
+            parts.append(f"{key}: null\n")
         else:
             escaped = str(value).replace("\n", " ")
-            lines.append(f"{key}: {escaped}")
-    lines.append("---")
-    return "\n".join(lines)
+            parts.append(f"{key}: {escaped}\n")
+    parts.append("---")
+    return "".join(parts)
 
 
 def render_entry_markdown(item: ProposalItem, proposal_id: str) -> str:
@@ -66,62 +123,88 @@ def render_summary_markdown(item: ProposalItem) -> str:
     assert item.summary is not None
     summary = item.summary
 
-    lines = [
-        f"# Summary for {item.entry_id}",
-        "",
-        summary.short_summary,
-        "",
-        "## Key Points",
-    ]
+    parts = [f"# Summary for {item.entry_id}\n\n{summary.short_summary}\n\n## Key Points\n"]
     if summary.key_points:
-        lines.extend(f"- {point}" for point in summary.key_points)
+        parts.extend(f"- {point}\n" for point in summary.key_points)
     else:
-        lines.append("- (none)")
+        parts.append("- (none)\n")
 
-    lines.extend(["", "## Actions"])
+    parts.append("\n## Actions\n")
     if summary.actions:
-        lines.extend(f"- {action}" for action in summary.actions)
+        parts.extend(f"- {action}\n" for action in summary.actions)
     else:
-        lines.append("- (none)")
-
-    lines.extend(["", "## Triggered By"])
-    lines.extend(f"- {signal}" for signal in summary.triggered_by)
-    lines.extend(["", f"Redundancy score: {summary.redundancy_score}", ""])
-    return "\n".join(lines)
+        parts.append("- (none)\n")
+
+    parts.append("\n## Triggered By\n")
+    parts.extend(f"- {signal}\n" for signal in summary.triggered_by)
+    parts.append(f"\nRedundancy score: {summary.redundancy_score}\n")
+    return "".join(parts)
+
+
+def _write_files(files: list[tuple[Path, str]]) -> None:
+    cpu_count = os.cpu_count() or 1
+    try:
+        if len(files) < PARALLEL_WRITE_MIN_FILES or cpu_count < 2:
+            for path, content in files:
+                atomic_write_text(path, content)
+            return
+
+        # The open/write/rename syscalls release the GIL, so threads overlap them.
+        paths = [path for path, _ in files]
+        contents = [content for _, content in files]
+        with ThreadPoolExecutor(max_workers=min(32, cpu_count * 4)) as executor:
+            list(executor.map(atomic_write_text, paths, contents))
+    except BaseException:
+        # The caller never sees a failed batch, so it cannot roll these files back itself.
+        for path, _ in files:
+            path.unlink(missing_ok=True)
+        raise
 
 
 def apply_proposal_to_vault(
     root: Path,
     proposal: Proposal,
-    existing_hashes: set[str],
-) -> tuple[list[dict[str, Any]], list[str], int, int]:
+    existing_hashes: set[bytes],
+) -> Iterator[tuple[list[dict[str, Any]], list[str]]]:
+    """Write the proposal's new entries and yield ``(entry_records, written_paths)`` per batch.
+
+    A batch's files are on disk when it is yielded. Ready items whose hash is already in
+    `existing_hashes` are skipped, so they show up in neither list.
+    """
     entry_records: list[dict[str, Any]] = []
     written_paths: list[str] = []
-    committed_count = 0
-    skipped_duplicates = 0
+    pending_writes: list[tuple[Path, str]] = []
+    # Entries share a handful of category folders, so each needs creating at most once per run.
+    ensured_dirs: set[Path] = set()
 
+    def _ensure(directory: Path) -> None:
+        if directory not in ensured_dirs:
+            ensure_dir(directory)
+            ensured_dirs.add(directory)
+
+    # Every entry in one commit shares the same commit timestamp.
+    now = now_utc_iso()
     for item in proposal.items:
         if item.status != "ready":
             continue
 
-        if item.content_hash in existing_hashes:
-            skipped_duplicates += 1
+        key = hash_key(item.content_hash)
+        if key in existing_hashes:
             continue
 
         entry_path = root / item.target_entry_path
-        ensure_dir(entry_path.parent)
-        atomic_write_text(entry_path, render_entry_markdown(item, proposal.proposal_id))
+        _ensure(entry_path.parent)
+        pending_writes.append((entry_path, render_entry_markdown(item, proposal.proposal_id)))
         written_paths.append(item.target_entry_path)
 
         summary_path = None
         if item.summary is not None and item.target_summary_path:
             summary_target = root / item.target_summary_path
-            ensure_dir(summary_target.parent)
-            atomic_write_text(summary_target, render_summary_markdown(item))
+            _ensure(summary_target.parent)
+            pending_writes.append((summary_target, render_summary_markdown(item)))
             written_paths.append(item.target_summary_path)
             summary_path = item.target_summary_path
 
-        now = now_utc_iso()
         entry_records.append(
             {
                 "entry_id": item.entry_id,
@@ -136,7 +219,13 @@ def apply_proposal_to_vault(
                 "committed_at": now,
             }
         )
-        existing_hashes.add(item.content_hash)
-        committed_count += 1
+        existing_hashes.add(key)
+
+        if len(entry_records) >= APPLY_BATCH_ENTRIES:
+            _write_files(pending_writes)
+            yield entry_records, written_paths
+            entry_records, written_paths, pending_writes = [], [], []
 
-    return entry_records, written_paths, committed_count, skipped_duplicates
+    if entry_records:
+        _write_files(pending_writes)
+        yield entry_records, written_paths
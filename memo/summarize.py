@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
-from difflib import SequenceMatcher
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from .config import SummarizationConfig
@@ -11,34 +13,108 @@ from .utils import normalize_for_similarity
 
 SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 BULLET_RE = re.compile(r"^\s*[-*]\s+(.+)$", re.MULTILINE)
-ACTION_RE = re.compile(r"^\s*[-*]?\s*(?:\[[ xX]\]\s*)?((?:do|build|write|ship|fix|review|plan|draft|call|email)\b.+)$", re.IGNORECASE)
+SHINGLE_SIZE = 3
+# Below this many words, similarity uses word sets rather than word 3-shingles.
+SHORT_TEXT_WORDS = 24
+ACTION_VERBS = ("do", "build", "write", "ship", "fix", "review", "plan", "draft", "call", "email")
+ACTION_RE = re.compile(
+    r"^\s*[-*]?\s*(?:\[[ xX]\]\s*)?((?:" + "|".join(ACTION_VERBS) + r")\b.+)$",
+    re.IGNORECASE,
+)
+CHECKBOX_ITEM_RE = re.compile(r"^\s*[-*]\s*\[[ xX]\]\s+(.+)$")
 
 
-def load_existing_summary_texts(root: Path) -> list[str]:
-    summary_dir = root / "vault" / "summaries"
-    if not summary_dir.exists():
-        return []
-    texts: list[str] = []
-    for path in sorted(summary_dir.glob("*.md")):
-        try:
-            texts.append(path.read_text(encoding="utf-8"))
-        except OSError:
-            continue
-    return texts
+def _word_count(text: str) -> int:
+    return len(text.split())
 
 
-def _word_count(text: str) -> int:
-    return len([part for part in re.split(r"\s+", text.strip()) if part])
+def _shingles(words: list[str]) -> frozenset[int]:
+    if len(words) <= SHINGLE_SIZE:
+        return frozenset((hash(tuple(words)),)) if words else frozenset()
+    return frozenset(hash(tuple(words[i : i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1))
+
+
+def _fingerprint(text: str) -> tuple[frozenset[int], frozenset[str]]:
+    """Return the word 3-shingles and the word set of `text`, after similarity normalization."""
+    words = normalize_for_similarity(text).split()
+    return _shingles(words), frozenset(words)
+
+
+@dataclass(slots=True)
+class SummaryIndex:
+    """Shingle and word sets of existing summaries, computed once per summary file."""
+
+    shingles: list[frozenset[int]] = field(default_factory=list)
+    vocabularies: list[frozenset[str]] = field(default_factory=list)
+
+    def add(self, fingerprint: tuple[frozenset[int], frozenset[str]]) -> None:
+        shingles, vocabulary = fingerprint
+        if shingles:
+            self.shingles.append(shingles)
+            self.vocabularies.append(vocabulary)
 
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "SummaryIndex":
+        index = cls()
+        for fingerprint in map(_fingerprint, texts):
+            index.add(fingerprint)
+        return index
 
-def _max_similarity(text: str, existing_texts: list[str]) -> float:
-    if not existing_texts:
+
+# Summary path -> ((mtime_ns, size), fingerprint); summaries are rarely rewritten once committed.
+_SUMMARY_SHINGLE_CACHE: dict[str, tuple[tuple[int, int], tuple[frozenset[int], frozenset[str]]]] = {}
+
+
+def load_existing_summaries(root: Path) -> SummaryIndex:
+    summary_dir = root / "vault" / "summaries"
+    if not summary_dir.exists():
+        return SummaryIndex()
+    index = SummaryIndex()
+    with os.scandir(summary_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md"):
+                continue
+            try:
+                stat = entry.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                cached = _SUMMARY_SHINGLE_CACHE.get(entry.path)
+                if cached is None or cached[0] != signature:
+                    cached = (signature, _fingerprint(Path(entry.path).read_text(encoding="utf-8")))
+                    _SUMMARY_SHINGLE_CACHE[entry.path] = cached
+            except OSError:
+                continue
+            index.add(cached[1])
+    return index
+
+
+def _max_similarity(text: str, existing: SummaryIndex) -> float:
+    """Highest Jaccard similarity between `text` and any existing summary.
+
+    Texts of at least SHORT_TEXT_WORDS words compare word 3-shingles. In shorter texts one edited
+    word touches most of the shingles, so those compare plain word sets instead.
+    """
+    if not existing.shingles:
         return 0.0
 
-    candidate = normalize_for_similarity(text)
+    words = normalize_for_similarity(text).split()
+    if not words:
+        return 0.0
+    candidate: frozenset[int] | frozenset[str]
+    others: list[frozenset[int]] | list[frozenset[str]]
+    if len(words) < SHORT_TEXT_WORDS:
+        candidate, others = frozenset(words), existing.vocabularies
+    else:
+        candidate, others = _shingles(words), existing.shingles
+
+    size = len(candidate)
     best = 0.0
-    for existing in existing_texts:
-        score = SequenceMatcher(None, candidate, normalize_for_similarity(existing)).ratio()
+    for other in others:
+        other_size = len(other)
+        # Jaccard can never exceed min/max of the set sizes, so skip pairs that cannot beat `best`.
+        if (other_size / size if other_size < size else size / other_size) <= best:
+            continue
+        shared = len(candidate & other)
+        score = shared / (size + other_size - shared)
         if score > best:
             best = score
     return best
@@ -48,7 +124,7 @@ def summarization_signals(
     item: StageItem,
     pending_count: int,
     config: SummarizationConfig,
-    existing_summary_texts: list[str],
+    existing_summaries: SummaryIndex,
 ) -> tuple[list[str], float]:
     if not config.enabled:
         return [], 0.0
@@ -60,7 +136,7 @@ def summarization_signals(
     if pending_count >= config.batch_trigger_count:
         signals.append("batch_threshold")
 
-    similarity = _max_similarity(item.body, existing_summary_texts)
+    similarity = _max_similarity(item.body, existing_summaries)
     if similarity >= config.redundancy_similarity_threshold:
         signals.append("high_redundancy")
 
@@ -74,36 +150,32 @@ def _extract_sentences(text: str) -> list[str]:
     return [segment.strip() for segment in SENTENCE_SPLIT_RE.split(normalized) if segment.strip()]
 
 
-def _extract_key_points(text: str) -> list[str]:
-    bullets = [match.strip() for match in BULLET_RE.findall(text)]
-    if bullets:
-        return bullets[:5]
-
-    sentences = _extract_sentences(text)
-    if not sentences:
-        return []
+def _extract_key_points(text: str, sentences: list[str]) -> list[str]:
+    # Every bullet needs a "-" or "*", so plain prose never enters the regex.
+    if "-" in text or "*" in text:
+        bullets = [match.strip() for match in BULLET_RE.findall(text)]
+        if bullets:
+            return bullets[:5]
     return sentences[:5]
 
 
 def _extract_actions(text: str) -> list[str]:
-    actions: list[str] = []
+    # An action line needs a checkbox or one of the verbs somewhere in the text. The check is
+    # limited to ASCII text, where lower() agrees with IGNORECASE (which also folds e.g. "ſ" to "s").
+    if "[" not in text and text.isascii():
+        lowered = text.lower()
+        if not any(verb in lowered for verb in ACTION_VERBS):
+            return []
+
+    # Keyed by lowercase text so the first spelling of each action wins.
+    unique_actions: dict[str, str] = {}
     for line in text.splitlines():
-        match = ACTION_RE.match(line)
+        match = ACTION_RE.match(line) or CHECKBOX_ITEM_RE.match(line)
         if match:
-            actions.append(match.group(1).strip())
-        elif re.match(r"^\s*[-*]\s*\[[ xX]\]\s+", line):
-            cleaned = re.sub(r"^\s*[-*]\s*\[[ xX]\]\s+", "", line).strip()
-            if cleaned:
-                actions.append(cleaned)
-    unique_actions: list[str] = []
-    seen = set()
-    for action in actions:
-        lowered = action.lower()
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        unique_actions.append(action)
-    return unique_actions[:8]
+            action = match.group(1).strip()
+            if action:
+                unique_actions.setdefault(action.lower(), action)
+    return list(unique_actions.values())[:8]
 
 
 def build_summary(item: StageItem, category: str, triggered_by: list[str], redundancy_score: float) -> SummaryResult:
@@ -111,7 +183,7 @@ def build_summary(item: StageItem, category: str, triggered_by: list[str], redun
     short_sentences = sentences[:3]
     short_summary = " ".join(short_sentences)[:500]
 
-    key_points = _extract_key_points(item.body)
+    key_points = _extract_key_points(item.body, sentences)
     actions: list[str] = []
     if category in {"todo", "idea"}:
         actions = _extract_actions(item.body)
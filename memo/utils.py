@@ -8,9 +8,19 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 
 def now_utc_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def ensure_dir(path: Path) -> None:
@@ -27,23 +37,53 @@ def sha256_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def atomic_write_text(path: Path, content: str) -> None:
-    ensure_dir(path.parent)
-    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+def decode_utf8_text(data: bytes) -> tuple[str, bool]:
+    """Decode UTF-8 with universal newlines; the flag says whether any newline was translated."""
+    text = data.decode("utf-8")
+    if "\r" not in text:
+        return text, False
+    return text.replace("\r\n", "\n").replace("\r", "\n"), True
+
+
+def read_text_utf8(path: Path) -> str:
+    """Read a UTF-8 file with universal newlines, like ``Path.read_text``, in one binary read."""
+    return decode_utf8_text(path.read_bytes())[0]
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    except FileNotFoundError:
+        # Create the parent only when it is missing, rather than a mkdir call per write.
+        ensure_dir(path.parent)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as tmp_file:
+        with os.fdopen(fd, "wb") as tmp_file:
             tmp_file.write(content)
         os.replace(tmp_name, path)
-    finally:
-        if os.path.exists(tmp_name):
-            os.remove(tmp_name)
+    except BaseException:
+        # Only a failed write or replace leaves the temp file behind.
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    atomic_write_bytes(path, content.encode("utf-8"))
 
 
 def atomic_write_json(path: Path, payload: Any) -> None:
+    if orjson is not None:
+        atomic_write_bytes(path, orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     atomic_write_text(path, json.dumps(payload, indent=2, ensure_ascii=True) + "\n")
 
 
 def read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
@@ -51,22 +91,50 @@ def read_json(path: Path) -> Any:
 def read_jsonl(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         return []
+    loads = json.loads if orjson is None else orjson.loads
     rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for raw_line in handle:
             line = raw_line.strip()
             if not line:
                 continue
-            rows.append(json.loads(line))
+            rows.append(loads(line))
     return rows
 
 
-def append_jsonl_atomic(path: Path, rows: list[dict[str, Any]]) -> None:
-    existing = ""
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-    suffix = "".join(json.dumps(row, ensure_ascii=True) + "\n" for row in rows)
-    atomic_write_text(path, existing + suffix)
+def _encode_jsonl(rows: list[dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+    return "".join(json.dumps(row, ensure_ascii=True) + "\n" for row in rows).encode("ascii")
+
+
+def append_bytes(path: Path, payload: bytes) -> None:
+    """Append `payload` with one locked write on an O_APPEND descriptor, then fsync it."""
+    ensure_dir(path.parent)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append_jsonl(path: Path, rows: list[dict[str, Any]], *, rewrite: bool = False) -> None:
+    """Append rows to a JSONL file in place via `append_bytes`.
+
+    Each row is a self-contained line, so a crash can at worst leave a partial last line.
+    Pass ``rewrite=True`` to instead rewrite the whole file atomically via a temp file.
+    """
+    payload = _encode_jsonl(rows)
+    if rewrite:
+        existing = path.read_bytes() if path.exists() else b""
+        atomic_write_bytes(path, existing + payload)
+        return
+    append_bytes(path, payload)
 
 
 def normalize_for_similarity(text: str) -> str:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
-from memo.classify import classify_item
+from memo import classify
+from memo.classify import classify_item, classify_items
 from memo.config import TaxonomyConfig
 from memo.models import StageItem
+from memo.utils import sha256_text
 
 
 class ClassifyTests(unittest.TestCase):
@@ -15,7 +18,7 @@ class ClassifyTests(unittest.TestCase):
         item = StageItem(
             source_path="/tmp/n.md",
             source_rel_path="stage/inbox/n.md",
-            content_hash="abc",
+            content_hash=sha256_text("- [ ] Write tests\n- [ ] Ship release #release"),
             created_at="2026-02-15T00:00:00+00:00",
             frontmatter={},
             body="- [ ] Write tests\n- [ ] Ship release",
@@ -29,7 +32,7 @@ class ClassifyTests(unittest.TestCase):
         item = StageItem(
             source_path="/tmp/n.md",
             source_rel_path="stage/inbox/n.md",
-            content_hash="abc",
+            content_hash=sha256_text("Short note"),
             created_at="2026-02-15T00:00:00+00:00",
             frontmatter={},
             body="Short note",
@@ -38,6 +41,46 @@ class ClassifyTests(unittest.TestCase):
         result = classify_item(item, self.taxonomy)
         self.assertEqual(result.category, "reference")
 
+    def test_repeated_content_returns_independent_results(self) -> None:
+        item = StageItem(
+            source_path="/tmp/n.md",
+            source_rel_path="stage/inbox/n.md",
+            content_hash=sha256_text("Idea: maybe we could try a new layout? #ux"),
+            created_at="2026-02-15T00:00:00+00:00",
+            frontmatter={},
+            body="Idea: maybe we could try a new layout?",
+            content="Idea: maybe we could try a new layout? #ux",
+        )
+        first = classify_item(item, self.taxonomy)
+        first.tags.append("mutated")
+        second = classify_item(item, self.taxonomy)
+        self.assertEqual(second.category, "idea")
+        self.assertNotIn("mutated", second.tags)
+        self.assertIn("ux", second.tags)
+
+    def test_parallel_classification_matches_serial(self) -> None:
+        items = [
+            StageItem(
+                source_path=f"/tmp/n{index}.md",
+                source_rel_path=f"stage/inbox/n{index}.md",
+                content_hash=sha256_text(f"- [ ] task {index} #batch{index}"),
+                created_at="2026-02-15T00:00:00+00:00",
+                frontmatter={},
+                body=f"- [ ] task {index}",
+                content=f"- [ ] task {index} #batch{index}",
+            )
+            for index in range(8)
+        ]
+        serial = [classify_item(item, self.taxonomy) for item in items]
+        # Forked workers inherit the parent's cache; clear it so they really classify.
+        classify._CLASSIFY_CACHE.clear()
+        with (
+            mock.patch.object(classify, "PARALLEL_CLASSIFY_MIN_ITEMS", 2),
+            mock.patch("memo.classify.os.cpu_count", return_value=2),
+        ):
+            parallel = classify_items(items, self.taxonomy)
+        self.assertEqual(parallel, serial)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from memo.config import DEFAULT_CONFIG, init_default_config, load_config
+
+
+class ConfigTests(unittest.TestCase):
+    def test_load_config_picks_up_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            self.assertEqual(load_config(root).summarization.min_words, 180)
+
+            config_path = init_default_config(root)
+            first = load_config(root)
+            first.taxonomy.core_categories.append("scratch")
+            first.summarization.min_words = 1
+            second = load_config(root)
+            self.assertEqual(second.summarization.min_words, 180)
+            self.assertNotIn("scratch", second.taxonomy.core_categories)
+
+            payload = json.loads(json.dumps(DEFAULT_CONFIG))
+            payload["summarization"]["min_words"] = 42
+            config_path.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+            self.assertEqual(load_config(root).summarization.min_words, 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from memo.cli import ensure_layout
 from memo.commit_flow import commit_proposal
@@ -25,6 +26,7 @@ class IntegrationFlowTests(unittest.TestCase):
 
             proposal = build_proposal(root, load_config(root))
             save_proposal(root, proposal)
+            self.assertFalse((root / "vault" / "index" / "hashes.bin").exists())
 
             result = commit_proposal(root, proposal.proposal_id, load_config(root))
             self.assertEqual(result.committed_entries, 1)
@@ -39,6 +41,29 @@ class IntegrationFlowTests(unittest.TestCase):
             processed_files = list((root / "stage" / "processed").glob("*note1.md"))
             self.assertEqual(len(processed_files), 1)
 
+    def test_commit_indexes_entries_across_write_batches(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            ensure_layout(root)
+            init_default_config(root)
+
+            for index in range(5):
+                note = root / f"note{index}.md"
+                note.write_text(f"Status update {index}: finished step {index} today.", encoding="utf-8")
+                stage_add(root, note)
+
+            proposal = build_proposal(root, load_config(root))
+            save_proposal(root, proposal)
+            with mock.patch("memo.storage.APPLY_BATCH_ENTRIES", 2):
+                result = commit_proposal(root, proposal.proposal_id, load_config(root))
+
+            self.assertEqual(result.committed_entries, 5)
+            self.assertEqual(result.skipped_duplicates, 0)
+            entries = read_jsonl(root / "vault" / "index" / "entries.jsonl")
+            self.assertEqual(len(entries), 5)
+            self.assertTrue(all((root / entry["entry_path"]).exists() for entry in entries))
+            self.assertEqual((root / "vault" / "index" / "hashes.bin").stat().st_size, 5 * 16)
+
     def test_duplicate_content_skips_second_write(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             root = Path(tmp_dir)
@@ -55,6 +80,38 @@ class IntegrationFlowTests(unittest.TestCase):
             r1 = commit_proposal(root, p1.proposal_id, load_config(root))
             self.assertEqual(r1.committed_entries, 1)
 
+            second = root / "second.md"
+            second.write_text(body, encoding="utf-8")
+            stage_add(root, second)
+            p2 = build_proposal(root, load_config(root))
+            self.assertEqual(p2.items[0].status, "duplicate")
+            self.assertEqual(p2.stats["duplicate_items"], 1)
+            save_proposal(root, p2)
+            r2 = commit_proposal(root, p2.proposal_id, load_config(root))
+
+            self.assertEqual(r2.committed_entries, 0)
+            self.assertEqual(r2.skipped_duplicates, 1)
+            self.assertEqual(list((root / "stage" / "inbox").iterdir()), [])
+
+    def test_duplicate_detection_rebuilds_missing_hash_sidecar(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            ensure_layout(root)
+            init_default_config(root)
+
+            body = "Status update: finished the migration today."
+
+            first = root / "first.md"
+            first.write_text(body, encoding="utf-8")
+            stage_add(root, first)
+            p1 = build_proposal(root, load_config(root))
+            save_proposal(root, p1)
+            commit_proposal(root, p1.proposal_id, load_config(root))
+
+            hashes_index = root / "vault" / "index" / "hashes.bin"
+            self.assertEqual(hashes_index.stat().st_size, 16)
+            hashes_index.unlink()
+
             second = root / "second.md"
             second.write_text(body, encoding="utf-8")
             stage_add(root, second)
@@ -64,6 +121,38 @@ class IntegrationFlowTests(unittest.TestCase):
 
             self.assertEqual(r2.committed_entries, 0)
             self.assertEqual(r2.skipped_duplicates, 1)
+            self.assertEqual(hashes_index.stat().st_size, 16)
+
+    def test_failed_commit_restores_indices(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            ensure_layout(root)
+            init_default_config(root)
+
+            first = root / "first.md"
+            first.write_text("Idea: maybe try a new layout?", encoding="utf-8")
+            stage_add(root, first)
+            p1 = build_proposal(root, load_config(root))
+            save_proposal(root, p1)
+            commit_proposal(root, p1.proposal_id, load_config(root))
+
+            index_dir = root / "vault" / "index"
+            index_names = ("entries.jsonl", "commits.jsonl", "hashes.bin", "commit_ids.txt")
+            before = {name: (index_dir / name).read_bytes() for name in index_names}
+
+            second = root / "second.md"
+            second.write_text("- [ ] Write the release notes", encoding="utf-8")
+            stage_add(root, second)
+            p2 = build_proposal(root, load_config(root))
+            save_proposal(root, p2)
+            with mock.patch("memo.commit_flow.move_stage_to_processed", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    commit_proposal(root, p2.proposal_id, load_config(root))
+
+            after = {name: (index_dir / name).read_bytes() for name in before}
+            self.assertEqual(after, before)
+            self.assertEqual(sorted(path.name for path in index_dir.iterdir()), sorted(before))
+            self.assertFalse((root / p2.items[0].target_entry_path).exists())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import unittest
+
+from memo.storage import HASH_KEY_SIZE, hash_key
+from memo.utils import sha256_text
+
+
+class StorageTests(unittest.TestCase):
+    def test_hash_key_is_fixed_width_prefix(self) -> None:
+        content_hash = sha256_text("note body")
+        key = hash_key(content_hash)
+        self.assertEqual(len(key), HASH_KEY_SIZE)
+        self.assertEqual(key.hex(), content_hash[: HASH_KEY_SIZE * 2])
+
+    def test_hash_key_rejects_malformed_hashes(self) -> None:
+        for content_hash in ("ababab", "z" * 64, "ab " * 21 + "a", sha256_text("x") + "00"):
+            with self.assertRaises(ValueError):
+                hash_key(content_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
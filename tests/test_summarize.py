@@ -4,7 +4,7 @@ import unittest
 
 from memo.config import SummarizationConfig
 from memo.models import StageItem
-from memo.summarize import build_summary, summarization_signals
+from memo.summarize import SummaryIndex, build_summary, summarization_signals
 
 
 class SummarizeTests(unittest.TestCase):
@@ -27,10 +27,55 @@ class SummarizeTests(unittest.TestCase):
             redundancy_similarity_threshold=0.9,
         )
         item = self._item("word " * 25)
-        signals, similarity = summarization_signals(item, pending_count=1, config=config, existing_summary_texts=[])
+        signals, similarity = summarization_signals(
+            item, pending_count=1, config=config, existing_summaries=SummaryIndex()
+        )
         self.assertIn("long_entry", signals)
         self.assertGreaterEqual(similarity, 0.0)
 
+    def test_near_duplicate_of_existing_summary_is_redundant(self) -> None:
+        config = SummarizationConfig(
+            enabled=True,
+            min_words=500,
+            batch_trigger_count=50,
+            redundancy_similarity_threshold=0.85,
+        )
+        existing = " ".join(f"word{index}" for index in range(200))
+        item = self._item(existing.replace("word57 ", "changed ", 1))
+        existing_summaries = SummaryIndex.from_texts([existing, "unrelated note"])
+        signals, similarity = summarization_signals(
+            item, pending_count=1, config=config, existing_summaries=existing_summaries
+        )
+        self.assertIn("high_redundancy", signals)
+        self.assertGreater(similarity, 0.85)
+        self.assertLess(similarity, 1.0)
+
+    def test_short_note_with_one_edit_is_redundant(self) -> None:
+        config = SummarizationConfig(
+            enabled=True,
+            min_words=500,
+            batch_trigger_count=50,
+            redundancy_similarity_threshold=0.7,
+        )
+        existing = (
+            "Met with the infra team today. We agreed to move the nightly backup job to the new "
+            "cluster next week and to retire the old storage nodes after that."
+        )
+        pairs = [
+            (existing, existing.replace("nightly", "weekly")),
+            ("Call the landlord about the broken boiler tomorrow", "Call the landlord about the broken heater tomorrow"),
+        ]
+        for original, edited in pairs:
+            with self.subTest(edited=edited):
+                signals, similarity = summarization_signals(
+                    self._item(edited),
+                    pending_count=1,
+                    config=config,
+                    existing_summaries=SummaryIndex.from_texts([original]),
+                )
+                self.assertIn("high_redundancy", signals)
+                self.assertLess(similarity, 1.0)
+
     def test_build_summary_extracts_actions_for_todo(self) -> None:
         body = "- [ ] write design doc\n- [ ] review roadmap\nThis note tracks tasks."
         item = self._item(body)